@@ -4,6 +4,7 @@
 
 import logging
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List, Mapping, Optional, Tuple, Union
 
 from lingpy.align.pairwise import sw_align
@@ -18,6 +19,20 @@ Scorer_T = Mapping[Tuple[str, str], float]
 # Lingpy aligner input type: tuple of str | list of str | str
 Seq_T = Union[Tuple[str], List[str], str]
 
+# Lingpy aligner output type: (prefix, alignment, suffix) for each sequence,
+# followed by the alignment score
+Alignment_T = Tuple[
+    Tuple[List[str], List[str], List[str]],
+    Tuple[List[str], List[str], List[str]],
+    float,
+]
+
+# Character lingpy uses to mark gaps in the alignments it returns
+LINGPY_GAP_CHAR = "-"
+
+# Maximum number of sequence pairs each aligner keeps cached alignments for
+ALIGN_CACHE_SIZE = 1 << 16
+
 
 class Aligner(ABC):
     """Abstract class; implements pairwise alignment.
@@ -42,12 +57,24 @@ class SmithWatermanAligner(Aligner):
     def __init__(self, scorer: Scorer_T = None, gap_char: str = "-") -> None:
         self.scorer = scorer
         self.gap_char = gap_char
+
+        # repeated sequence pairs are common in formulaic texts; cache their
+        # alignments per instance, since the scorer is fixed for its lifetime
+        self._align = lru_cache(maxsize=ALIGN_CACHE_SIZE)(self._sw_align)
         logging.info(f'using {self.__class__} with gap_char="{gap_char}"')
 
     def _get_seqs(self, match: Match) -> Tuple[Seq_T, Seq_T]:
         """Get the two sequences to compare."""
         return match.utxt.text, match.vtxt.text
 
+    def _sw_align(self, su: Tuple[str, ...], sv: Tuple[str, ...]) -> Alignment_T:
+        """Align two sequences, keeping the non-aligned regions."""
+        # with the default scorer identical sequences always align end to end
+        # without gaps, so build that alignment directly instead of the full DP
+        if self.scorer is None and su and su == sv:
+            return ([], list(su), []), ([], list(sv), []), float(len(su))
+        return sw_align(su, sv, self.scorer)
+
     def __call__(self, match: Match) -> Match:
         """Perform the alignment and use it to modify the provided match.
 
@@ -56,9 +83,8 @@ class SmithWatermanAligner(Aligner):
         and sequence texts calculated for the alignment."""
 
         # compute the alignment and keep non-aligned regions
-        (lu, cu, _ru), (lv, cv, _rv), score = sw_align(
-            *self._get_seqs(match), self.scorer
-        )
+        su, sv = self._get_seqs(match)
+        (lu, cu, _ru), (lv, cv, _rv), score = self._align(tuple(su), tuple(sv))
 
         # use lengths of non-aligned regions to move the sequence boundaries
         # [...] ["A", "B", "C"] [...]
@@ -69,29 +95,38 @@ class SmithWatermanAligner(Aligner):
         vtxt = v[vs : vs + len(cv)]
 
         # use the gaps in the alignment to construct a new sequence of token
-        # texts, inserting gap_char wherever the aligner created a gap
+        # texts, inserting gap_char wherever the aligner created a gap. both
+        # sides of the alignment have the same length, which bounds the loop
+        u_texts = [token.text for token in utxt]
+        v_texts = [token.text for token in vtxt]
         u_ptr = 0
         v_ptr = 0
         au = []
         av = []
-        for i in range(max(len(utxt), len(vtxt))):
-            if cu[i] != "-":
-                au.append(utxt[u_ptr].text)
+        for i in range(len(cu)):
+            if cu[i] != LINGPY_GAP_CHAR:
+                au.append(u_texts[u_ptr])
                 u_ptr += 1
             else:
                 au.append(self.gap_char)
-            if cv[i] != "-":
-                av.append(vtxt[v_ptr].text)
+            if cv[i] != LINGPY_GAP_CHAR:
+                av.append(v_texts[v_ptr])
                 v_ptr += 1
             else:
                 av.append(self.gap_char)
 
         # trim back the sequence boundaries further to remove any non-alphanum.
         # tokens from the start and end of both alignment and orig. sequence
-        while not au[-1].isalnum() or not av[-1].isalnum():
-            utxt, vtxt, au, av = utxt[:-1], vtxt[:-1], au[:-1], av[:-1]
-        while not au[0].isalnum() or not av[0].isalnum():
-            utxt, vtxt, au, av = utxt[1:], vtxt[1:], au[1:], av[1:]
+        alnum = [a.isalnum() and b.isalnum() for a, b in zip(au, av)]
+        start, trail = 0, 0
+        while not alnum[-1 - trail]:
+            trail += 1
+        while not alnum[start]:
+            start += 1
+        utxt = utxt[start : len(utxt) - trail]
+        vtxt = vtxt[start : len(vtxt) - trail]
+        au = au[start : len(au) - trail]
+        av = av[start : len(av) - trail]
 
         # normalize score to length; 1.0 is perfect
         norm_score = float(score) / max(len(au), len(av))
@@ -111,9 +146,9 @@ class SmithWatermanPhoneticAligner(SmithWatermanAligner):
 
     def _get_seqs(self, match: Match) -> Tuple[Seq_T, Seq_T]:
         """Get the phonemes of the two sequences for comparison."""
-        # combine the phonemes for each token into a single string; if there's
-        # no phonetic content, use the token text in place of the phonemes
+        # use the phonemes for each token as a single string; if there's no
+        # phonetic content, use the token text in place of the phonemes
         return (
-            ["".join([p or "" for p in t._.phonemes]) or t.text for t in match.utxt],
-            ["".join([p or "" for p in t._.phonemes]) or t.text for t in match.vtxt],
+            [t._.phoneme_str or t.text for t in match.utxt],
+            [t._.phoneme_str or t.text for t in match.vtxt],
         )
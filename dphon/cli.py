@@ -93,9 +93,10 @@ import csv
 import logging
 import os
 import time
-from itertools import combinations
+from itertools import combinations, product
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Tuple, Type
 
 import jsonlines
 import pkg_resources
@@ -106,7 +107,7 @@ from rich.logging import RichHandler
 from rich.padding import Padding
 from rich.progress import BarColumn, Progress, SpinnerColumn
 from spacy.language import Language
-from spacy.tokens import Doc
+from spacy.tokens import Doc, Span
 
 from . import __version__
 from .align import SmithWatermanPhoneticAligner
@@ -114,9 +115,18 @@ from .console import MatchHighlighter, console, err_console
 from .corpus import CorpusLoader, JsonLinesCorpusLoader, PlaintextCorpusLoader
 from .extend import LevenshteinPhoneticExtender
 from .g2p import get_sound_table_json
-from .match import Match
+from .match import MATCH_FIELDS, Match
 from .reuse import MatchGraph, MatchGroup
 
+# use orjson for writing JSON lines output if available; fall back to stdlib json
+try:
+    from orjson import dumps as json_dumps
+except ImportError:
+    from functools import partial
+    from json import dumps
+
+    json_dumps = partial(dumps, ensure_ascii=False)  # type: ignore[assignment]
+
 # Available log levels: default is WARN, -v is INFO, -vv is DEBUG
 LOG_LEVELS = {
     0: "WARN",
@@ -124,6 +134,16 @@ LOG_LEVELS = {
     2: "DEBUG",
 }
 
+# Available corpus loaders by input format; default is plaintext
+CORPUS_LOADERS: Dict[str, Type[CorpusLoader]] = {
+    "txt": PlaintextCorpusLoader,
+    "jsonl": JsonLinesCorpusLoader,
+}
+
+# Buffer size for output files; results are written in one large chunk rather
+# than issuing a separate write for every serialized match
+OUTPUT_BUFFER_SIZE = 1 << 20
+
 
 def run() -> None:
     """CLI entrypoint."""
@@ -151,6 +171,7 @@ def run() -> None:
     graph = process(nlp, args)
 
     # check if we're outputting to a file and find out the format
+    output_format = None
     if args["--output-file"]:
         output_path = Path(args["--output-file"])
         output_format = output_path.suffix.lstrip(".").lower()
@@ -165,19 +186,21 @@ def run() -> None:
         results = list(graph.matches)
 
     # sort results by highest weighted score
-    results = sorted(results, key=lambda result: result.weighted_score, reverse=True)
+    results = sorted(results, key=attrgetter("weighted_score"), reverse=True)
 
     # output depending on provided option
     if output_format == "jsonl":
-        with jsonlines.Writer(output_path) as writer:
-            for result in results:
-                writer.write(result.as_dict())
+        with output_path.open(
+            "wb", buffering=OUTPUT_BUFFER_SIZE
+        ) as jsonl_file, jsonlines.Writer(jsonl_file, dumps=json_dumps) as jsonl_writer:
+            jsonl_writer.write_all(result.as_dict() for result in results)
     elif output_format == "csv":
-        fieldnames = Match("", "", "", "").as_dict().keys()
-        writer = csv.DictWriter(output_path, fieldnames=fieldnames)
-        writer.writeheader()
-        for result in results:
-            writer.writerow(result.as_dict())
+        with output_path.open(
+            "w", encoding="utf8", newline="", buffering=OUTPUT_BUFFER_SIZE
+        ) as csv_file:
+            csv_writer = csv.DictWriter(csv_file, fieldnames=MATCH_FIELDS)
+            csv_writer.writeheader()
+            csv_writer.writerows(result.as_dict() for result in results)
     elif output_format == "html":
         console.record = True
         for result in results:
@@ -204,7 +227,8 @@ def setup(args: Dict) -> Language:
 
     # setup spaCy model
     nlp = spacy.blank("zh", meta={"tokenizer": {"config": {"use_jieba": False}}})
-    nlp.add_pipe("g2p", config={"sound_table": sound_table})
+    # spaCy configs must be plain JSON-serializable dicts, so copy the table
+    nlp.add_pipe("g2p", config={"sound_table": dict(sound_table)})
     nlp.add_pipe("ngrams", config={"n": int(args["--ngram-order"])})
     nlp.add_pipe("ngram_phonemes_index", name="index")
     logging.info("loaded default spaCy model")
@@ -215,18 +239,15 @@ def process(nlp: Language, args: Dict) -> MatchGraph:
     """Run the spaCy processing pipeline."""
     # set up graph and loader
     graph = MatchGraph()
-    load_texts: CorpusLoader
-    if args["--input-format"] == "jsonl":
-        load_texts = JsonLinesCorpusLoader()
-    else:
-        load_texts = PlaintextCorpusLoader()
+    loader = CORPUS_LOADERS.get(args["--input-format"], PlaintextCorpusLoader)
+    load_texts = loader()
 
     # load and index all documents
     start = time.perf_counter()
     for doc, context in nlp.pipe(load_texts(args["<path>"]), as_tuples=True):
         doc._.id = context["id"]
         graph.add_doc(doc)
-        logging.debug(f'indexed doc "{doc._.id}"')
+        logging.debug('indexed doc "%s"', doc._.id)
     stop = time.perf_counter() - start
     logging.info(f"indexed {graph.number_of_docs} docs in {stop:.1f}s")
 
@@ -243,29 +264,45 @@ def process(nlp: Language, args: Dict) -> MatchGraph:
         "[progress.percentage]{task.percentage:>3.1f}%",
         console=err_console,
         transient=True,
+        disable=not err_console.is_terminal,
     )
     task = progress.add_task("seeding", seed="", total=len(groups))
+    keep_all = args["--all"]
+    has_variant = nlp.get_pipe("g2p").has_variant
     start = time.perf_counter()
     with progress:
         for _seed, locations in groups:
+            texts = [location.text for location in locations]
+            seed_text = texts[0]
             logging.debug(
-                f'evaluating seed group "{locations[0].text}", size={len(locations)}'
+                'evaluating seed group "%s", size=%d', seed_text, len(locations)
             )
-            progress.update(task, seed=locations[0].text)
-            for utxt, vtxt in combinations(locations, 2):
-                if utxt.doc._.id != vtxt.doc._.id:  # skip same-doc matches
-                    graph.add_match(
-                        Match(utxt.doc._.id, vtxt.doc._.id, utxt, vtxt, 1.0)
-                    )
+            progress.update(task, seed=seed_text)
+
+            # all locations share the seed's phonemes; if they also share one
+            # text, none of them can be graphic variants, so skip the group
+            if not keep_all and len(set(texts)) == 1:
+                progress.advance(task)
+                continue
+
+            # bucket locations by doc so that same-doc pairs are never created,
+            # then pair up every location in one doc with those in each other
+            locations_by_doc: Dict[str, List[Tuple[Span, str]]] = {}
+            for location, text in zip(locations, texts):
+                locations_by_doc.setdefault(location.doc._.id, []).append(
+                    (location, text)
+                )
+            for (u, utxts), (v, vtxts) in combinations(locations_by_doc.items(), 2):
+                for (utxt, utext), (vtxt, vtext) in product(utxts, vtxts):
+                    # unless we're keeping all matches, only keep seeds with
+                    # graphic variants; identical texts can't contain any
+                    match = Match(u, v, utxt, vtxt, 1.0)
+                    if keep_all or (utext != vtext and has_variant(match)):
+                        graph.add_match(match)
             progress.advance(task)
     stop = time.perf_counter() - start
     logging.info(f"seeded {graph.number_of_matches} matches in {stop:.1f}s")
 
-    # limit to seeds with graphic variants if requested
-    if not args["--all"]:
-        has_variant = nlp.get_pipe("g2p").has_variant
-        graph.filter(has_variant)
-
     # extend all matches
     graph.extend(
         LevenshteinPhoneticExtender(
@@ -276,27 +313,29 @@ def process(nlp: Language, args: Dict) -> MatchGraph:
     # align all matches
     graph.align(SmithWatermanPhoneticAligner(gap_char="　"))
 
-    # filter if requested
+    # filter if requested; parse each bound once, then check all of them in a
+    # single pass over the graph
+    checks: List[Callable[[Match], bool]] = []
     if args["--min-length"]:
-        graph.filter(lambda m: len(m) >= int(args["--min-length"]))
+        min_length = int(args["--min-length"])
+        checks.append(lambda m: len(m) >= min_length)
     if args["--max-length"]:
-        graph.filter(lambda m: len(m) <= int(args["--max-length"]))
+        max_length = int(args["--max-length"])
+        checks.append(lambda m: len(m) <= max_length)
     if args["--min-graphic-similarity"]:
-        graph.filter(
-            lambda m: m.graphic_similarity >= float(args["--min-graphic-similarity"])
-        )
+        min_graphic = float(args["--min-graphic-similarity"])
+        checks.append(lambda m: m.graphic_similarity >= min_graphic)
     if args["--max-graphic-similarity"]:
-        graph.filter(
-            lambda m: m.graphic_similarity <= float(args["--max-graphic-similarity"])
-        )
+        max_graphic = float(args["--max-graphic-similarity"])
+        checks.append(lambda m: m.graphic_similarity <= max_graphic)
     if args["--min-phonetic-similarity"]:
-        graph.filter(
-            lambda m: m.phonetic_similarity >= float(args["--min-phonetic-similarity"])
-        )
+        min_phonetic = float(args["--min-phonetic-similarity"])
+        checks.append(lambda m: m.phonetic_similarity >= min_phonetic)
     if args["--max-phonetic-similarity"]:
-        graph.filter(
-            lambda m: m.phonetic_similarity <= float(args["--max-phonetic-similarity"])
-        )
+        max_phonetic = float(args["--max-phonetic-similarity"])
+        checks.append(lambda m: m.phonetic_similarity <= max_phonetic)
+    if checks:
+        graph.filter(lambda m: all(check(m) for check in checks))
 
     # group all matches
     graph.group()
@@ -98,34 +98,36 @@ class MatchHighlighter(RegexHighlighter):
         span_ptr = 0
         other_ptr = 0
         for i in range(len(span)):
+            char, other_char = alignment[i], other_alignment[i]
+
             # gap in u: insertion in v (if not punctuation)
-            if alignment[i] == self.gap_char and other_alignment[i].isalnum():
+            if char == self.gap_char and other_char.isalnum():
                 other_ptr += 1
                 continue
 
             # gap in v: insertion in u (if not punctuation)
-            if other_alignment[i] == self.gap_char and alignment[i].isalnum():
-                marked_span.append(f"[insertion]{alignment[i]}[/insertion]")
+            if other_char == self.gap_char and char.isalnum():
+                marked_span.append(f"[insertion]{char}[/insertion]")
                 span_ptr += 1
                 continue
 
             # variants (both u and v)
             if self.g2p.are_graphic_variants(span[span_ptr], other[other_ptr]):
-                marked_span.append(f"[variant]{alignment[i]}[/variant]")
+                marked_span.append(f"[variant]{char}[/variant]")
                 span_ptr += 1
                 other_ptr += 1
                 continue
 
             # mismatch (both u and v) - only highlight if alphanumeric
-            if alignment[i] != other_alignment[i]:
-                if alignment[i].isalnum() and other_alignment[i].isalnum():
-                    marked_span.append(f"[mismatch]{alignment[i]}[/mismatch]")
+            if char != other_char:
+                if char.isalnum() and other_char.isalnum():
+                    marked_span.append(f"[mismatch]{char}[/mismatch]")
                     span_ptr += 1
                     other_ptr += 1
                     continue
 
             # equality; nothing to highlight
-            marked_span.append(alignment[i])
+            marked_span.append(char)
             span_ptr += 1
             other_ptr += 1
 
@@ -8,6 +8,7 @@ from abc import ABC, abstractmethod
 from collections import OrderedDict
 from glob import glob
 from pathlib import Path
+from stat import S_ISREG
 from typing import Any, Dict, Iterable, Tuple, Union
 
 from rich.progress import Progress, BarColumn, TextColumn, SpinnerColumn
@@ -45,6 +46,7 @@ class CorpusLoader(ABC):
             "[progress.percentage]{task.percentage:>3.1f}%",
             console=err_console,
             transient=True,
+            disable=not err_console.is_terminal,
         )
 
     @abstractmethod
@@ -71,11 +73,20 @@ class CorpusLoader(ABC):
         # if we succeed so that we can later open the file using it
         for path in paths:
             for file in map(Path, glob(path)):
-                if file.is_file() and file.suffix == self.filetype:
-                    size = file.stat().st_size
+                # stat each path once; both its mode and size are needed
+                try:
+                    file_stat = file.stat()
+                except OSError:
+                    file_stat = None
+                if (
+                    file_stat
+                    and S_ISREG(file_stat.st_mode)
+                    and file.suffix == self.filetype
+                ):
+                    size = file_stat.st_size
                     files[file] = {"size": size, "id": file.stem}
                     total += 1
-                    logging.debug(f"found {file.resolve()}, size={size}B")
+                    logging.debug("found %s, size=%dB", file.resolve(), size)
                 else:
                     logging.warning(
                         f"path {file.resolve()} isn't a {self.filetype} file"
@@ -121,14 +132,14 @@ class PlaintextCorpusLoader(CorpusLoader):
         # track progress
         task = self.progress.add_task("indexing", filename="", total=len(files))
 
-        # open each file and yield contents with metadata as DocInfo_T
+        # read each file and yield contents with metadata as DocInfo_T
         with self.progress:
             for file, meta in files_by_size.items():
                 self.progress.update(task, filename=file.name)
-                with file.open(encoding="utf8") as contents:
-                    logging.debug(f"loaded doc \"{meta['id']}\" from {file.resolve()}")
-                    yield contents.read().translate(OC_TEXT), {"id": meta["id"]}
-                    self.progress.advance(task)
+                text = file.read_bytes().decode("utf8").translate(OC_TEXT)
+                logging.debug('loaded doc "%s" from %s', meta["id"], file.resolve())
+                yield text, {"id": meta["id"]}
+                self.progress.advance(task)
 
 
 class JsonLinesCorpusLoader(CorpusLoader):
@@ -164,10 +175,9 @@ class JsonLinesCorpusLoader(CorpusLoader):
             for file in files.keys():
                 with jsonlines.open(file) as reader:
                     self.progress.update(task, filename=file.name)
+                    path = file.resolve()
                     for doc in reader:
                         meta = {k: v for k, v in doc.items() if k != "text"}
-                        logging.debug(
-                            f"loaded doc \"{doc['id']}\" from {file.resolve()}"
-                        )
+                        logging.debug('loaded doc "%s" from %s', doc["id"], path)
                         yield doc["text"].translate(OC_TEXT), meta
                     self.progress.advance(task)
@@ -2,10 +2,11 @@
 # -*- coding: utf-8 -*-
 """Tools for converting graphemes to phonemes."""
 
-import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Iterator, Mapping, Optional, Tuple, List
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple, List
 
 from spacy.language import Language
 from spacy.lookups import Table
@@ -13,6 +14,12 @@ from spacy.tokens import Doc, Span, Token
 
 from dphon.match import Match
 
+# use orjson for loading sound tables if available; fall back to stdlib json
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
 # private use unicode char that represents phonemes for OOV tokens
 OOV_PHONEMES = "\ue000"
 
@@ -31,6 +38,7 @@ class GraphemesToPhonemes:
     - `Doc._.phonemes`: iterator over all phonemes in a `spacy.tokens.Doc`
     - `Span._.phonemes`: iterator over all phonemes in a `spacy.tokens.Span`
     - `Token._.phonemes`: iterator over all phonemes in a `spacy.tokens.Token`
+    - `Token._.phoneme_str`: all phonemes in a `spacy.tokens.Token` as a string
     - `Token._.is_oov`: check whether a token can be converted to phonemes
 
     Args:
@@ -39,6 +47,9 @@ class GraphemesToPhonemes:
     """
 
     _table: Table  # uses spaCy's lookup tables (bloom filtered dict)
+    syllables: Table  # full syllable string for each entry in the table
+    _phonemes: Dict[str, Phonemes_T]  # cache of token phonemes by text
+    _phoneme_strs: Dict[str, str]  # cache of token phoneme strings by text
 
     def __init__(self, nlp: Language, sound_table: SoundTable_T):
         # infer the syllable segmentation and map it to an empty phoneme set
@@ -54,11 +65,22 @@ class GraphemesToPhonemes:
             Span.set_extension("syllables", getter=self._get_syllables)
         if not Token.has_extension("phonemes"):
             Token.set_extension("phonemes", getter=self.get_token_phonemes)
+        if not Token.has_extension("phoneme_str"):
+            Token.set_extension("phoneme_str", getter=self.get_token_phoneme_str)
         if not Token.has_extension("is_oov"):
             Token.set_extension("is_oov", getter=self.is_token_oov)
 
         # store the sound table in the vocab's Lookups
         self.table = nlp.vocab.lookups.add_table("phonemes", sound_table)
+
+        # precompute full syllable strings once per entry for transcription
+        syllables = {
+            char: "".join(p or "" for p in reading)
+            for char, reading in sound_table.items()
+        }
+        self.syllables = nlp.vocab.lookups.add_table("syllables", syllables)
+        self._phonemes = {}
+        self._phoneme_strs = {}
         logging.info(f"using {self.__class__}")
 
     def __call__(self, doc: Doc) -> Doc:
@@ -141,21 +163,45 @@ class GraphemesToPhonemes:
         use a special marker (`OOV_PHONEMES`).
         - If some parts of the syllable are not present, their corresponding
         elements in the tuple will be `None`.
+        - Results are cached by token text, since a token's phonemes depend
+        only on its text.
         """
 
+        try:
+            return self._phonemes[token.text]
+        except KeyError:
+            phonemes = self._lookup_token_phonemes(token)
+            self._phonemes[token.text] = phonemes
+            return phonemes
+
+    def _lookup_token_phonemes(self, token: Token) -> Phonemes_T:
+        """Look up `token`'s phonemes in the sound table."""
         if not token.is_alpha and not token.like_num:
             return self.empty_phonemes
         elif token._.is_oov:
-            logging.debug(f'no phonemes for token: "{token.text}"')
+            logging.debug('no phonemes for token: "%s"', token.text)
             return (OOV_PHONEMES,)
         else:
             return self._select(self.table[token.text])
 
-    def _get_token_syllable(self, token: Token) -> str:
+    def get_token_phoneme_str(self, token: Token) -> str:
+        """Return all of `token`'s phonemes joined as a single string.
+
+        - Skips parts of the syllable that are not used (stored as None), so
+        non-voiced tokens return an empty string.
+        - Results are cached by token text, since a token's phonemes depend
+        only on its text.
+        """
+
         try:
-            return "".join(self.table[token.text])
+            return self._phoneme_strs[token.text]
         except KeyError:
-            return ""
+            phoneme_str = "".join(p for p in self.get_token_phonemes(token) if p)
+            self._phoneme_strs[token.text] = phoneme_str
+            return phoneme_str
+
+    def _get_token_syllable(self, token: Token) -> str:
+        return self.syllables.get(token.text, "")
 
     def _get_syllables(self, tokens: Iterable[Token]) -> List[str]:
         return [self._get_token_syllable(token) for token in tokens]
@@ -169,23 +215,30 @@ class GraphemesToPhonemes:
         return (initial, nucleus, coda)
 
 
+@lru_cache(maxsize=4)
 def get_sound_table_json(path: Path) -> SoundTable_T:
-    """Load a sound table as JSON."""
-    sound_table: SoundTable_T = {}
+    """Load a sound table as JSON.
+
+    Tables are cached by path, so loading the same table again (e.g. when
+    setting up more than one pipeline) doesn't re-parse the file. Since the
+    same table is shared between callers, it is returned as a read-only
+    mapping.
+    """
+    sound_table: Dict[str, Phonemes_T] = {}
 
     # open the file and load all readings
-    with open(path, encoding="utf8") as file:
-        entries = json.loads(file.read())
+    with open(path, "rb") as file:
+        entries = json_loads(file.read())
         for char, readings in entries.items():
 
             # FIXME just using first reading for now, ignoring multiple
             # NOTE final two entries in current table are source info; ignore
             *reading, _src, _src2 = readings[0]
-            sound_table[char] = tuple(reading)  # type: ignore
+            sound_table[char] = tuple(reading)
 
     # log and return finished table
     logging.info(f"sound table {path.resolve()} loaded")
-    return sound_table
+    return MappingProxyType(sound_table)
 
 
 @Language.factory("g2p")
@@ -2,7 +2,6 @@
 # -*- coding: utf-8 -*-
 """Tools for building indices of document data."""
 
-from dphon.g2p import OOV_PHONEMES
 import logging
 from abc import ABC, abstractmethod
 from typing import Callable, Hashable, Iterable, Iterator, List, Tuple, TypeVar, Generic
@@ -157,17 +156,30 @@ class NgramPhonemesLookupsIndex(LookupsIndex[Span]):
     def _get_vals(self, doc: Doc) -> Iterator[Span]:
         """Iterator over phonetic ngrams in the doc.
 
-        Discards any ngrams containing non-voiced content, and any for which
-        the g2p model did not have phonetic information.
+        Discards any ngrams containing non-voiced content (including whitespace
+        between tokens), and any for which the g2p model did not have phonetic
+        information.
         """
 
+        # check each token once instead of once per ngram it appears in, and
+        # keep running counts so each ngram can be checked by its bounds alone
+        unusable = [0]  # tokens that are non-alphabetic or have no phonemes
+        spaced = [0]  # tokens followed by whitespace
+        for token in doc:
+            usable = token.is_alpha and not token._.is_oov
+            unusable.append(unusable[-1] + (not usable))
+            spaced.append(spaced[-1] + bool(token.whitespace_))
+
+        # keep ngrams with no unusable tokens and no whitespace inside them
         for ngram in doc._.ngrams:
-            if ngram.text.isalpha() and OOV_PHONEMES not in ngram._.phonemes:
+            start, end = ngram.start, ngram.end
+            if unusable[end] == unusable[start] and spaced[end - 1] == spaced[start]:
                 yield ngram
 
     def _get_key(self, val: Span) -> str:
         """All phonetic content of an ngram as a string."""
-        return "".join(val._.phonemes)
+        # reuse each token's cached phoneme string rather than walking phonemes
+        return "".join([token._.phoneme_str for token in val])
 
 
 @Language.factory("ngram_phonemes_index")
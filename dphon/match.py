@@ -11,6 +11,22 @@ from rich.padding import Padding
 from rich.table import Table
 from spacy.tokens import Span
 
+# Field names of a serialized match, in order; see `Match.as_dict()`
+MATCH_FIELDS = (
+    "u_id",
+    "v_id",
+    "u_text",
+    "v_text",
+    "u_text_aligned",
+    "v_text_aligned",
+    "u_start",
+    "u_end",
+    "v_start",
+    "v_end",
+    "phonetic_similarity",
+    "graphic_similarity",
+)
+
 
 class Match(NamedTuple):
     """A match is a pair of similar textual sequences in two documents."""
@@ -114,6 +114,7 @@ class MatchGraph:
             "{task.percentage:>3.1f}%",
             console=err_console,
             transient=True,
+            disable=not err_console.is_terminal,
         )
 
     @property
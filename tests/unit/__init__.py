@@ -0,0 +1,21 @@
+"""Shared helpers for unit tests."""
+
+from spacy.tokens import Doc, Span, Token
+
+# extensions registered by the pipeline that other tests set up themselves
+PIPELINE_EXTENSIONS = [
+    (Doc, "phonemes"),
+    (Doc, "ngrams"),
+    (Span, "phonemes"),
+    (Span, "syllables"),
+    (Token, "phonemes"),
+    (Token, "phoneme_str"),
+    (Token, "is_oov"),
+]
+
+
+def remove_pipeline_extensions() -> None:
+    """Remove any extensions bound by the pipeline's components."""
+    for obj, name in PIPELINE_EXTENSIONS:
+        if obj.has_extension(name):
+            obj.remove_extension(name)
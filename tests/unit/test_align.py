@@ -2,11 +2,12 @@
 """Aligner unit tests."""
 
 from unittest import TestCase
+from unittest.mock import patch
 
 import spacy
 from dphon.match import Match
 from dphon.align import SmithWatermanAligner
-from lingpy.align.pairwise import _get_scorer
+from lingpy.align.pairwise import _get_scorer, sw_align
 
 
 class TestSmithWatermanAligner(TestCase):
@@ -41,6 +42,40 @@ class TestSmithWatermanAligner(TestCase):
         self.assertEqual(aligned.av, list(v.text))
         self.assertEqual(aligned.weight, 1.0)
 
+    def test_identical_skips_dp(self) -> None:
+        """Identical sequences should be aligned without calling sw_align."""
+
+        # create docs and a match
+        u = self.nlp.make_doc("千室之邑百乘之家")
+        v = self.nlp.make_doc("千室之邑百乘之家")
+        match = Match("analects", "shiji", u[:], v[:])
+
+        # alignment should be complete without running the full DP
+        with patch("dphon.align.sw_align") as sw_align:
+            aligned = self.align(match)
+            sw_align.assert_not_called()
+        self.assertEqual(aligned.au, list(u.text))
+        self.assertEqual(aligned.av, list(v.text))
+        self.assertEqual(aligned.weight, 1.0)
+
+    def test_cache(self) -> None:
+        """Repeated sequence pairs should only be aligned once."""
+
+        # create two matches between different docs with the same texts
+        u = self.nlp.make_doc("子如鄉黨恂恂如也似不能言者")
+        v = self.nlp.make_doc("子於鄉黨恂恂如也父母之國")
+        match1 = Match("a", "b", u[:], v[:])
+        match2 = Match("c", "d", u[:], v[:])
+
+        # second alignment should reuse the first
+        with patch("dphon.align.sw_align", wraps=sw_align) as mock:
+            aligned1 = self.align(match1)
+            aligned2 = self.align(match2)
+            mock.assert_called_once()
+        self.assertEqual(aligned1.au, aligned2.au)
+        self.assertEqual(aligned1.av, aligned2.av)
+        self.assertEqual(aligned1.weight, aligned2.weight)
+
     def test_trim(self) -> None:
         """Matches with a trailing portion that doesn't match should be trimmed.
 
@@ -99,6 +134,21 @@ class TestSmithWatermanAligner(TestCase):
             "可使為之宰------------赤也束帶立於朝可使與賓客言也"
         )))
 
+    def test_spacing_at_end(self) -> None:
+        """Alignments should keep tokens after a gap at the end of the docs."""
+
+        # create a match where both sequences have a gap near the end
+        u = self.nlp.make_doc("ABXCD")
+        v = self.nlp.make_doc("ABCYD")
+        match = Match("u", "v", u[:], v[:])
+
+        # final aligned token shouldn't be dropped
+        aligned = self.align(match)
+        self.assertEqual(aligned.au, list("ABXC-D"))
+        self.assertEqual(aligned.av, list("AB-CYD"))
+        self.assertEqual(aligned.utxt.text, "ABXCD")
+        self.assertEqual(aligned.vtxt.text, "ABCYD")
+
     def test_scorer(self) -> None:
         """scoring matrix should affect alignment"""
         # special scoring matrix for testing where B == A
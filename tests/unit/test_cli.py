@@ -1,14 +1,26 @@
 """Tests for the cli module."""
 
+import csv
 import logging
 import sys
 from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import patch
 
+import jsonlines
+
 from dphon.cli import __doc__ as doc
 from dphon.cli import __version__ as version
 from dphon.cli import run
+from dphon.match import MATCH_FIELDS
+
+from tests.unit import remove_pipeline_extensions
+
+# fixture texts known to contain matches with graphic variants
+FIXTURES = Path(__file__).parents[1] / "fixtures" / "laozi"
+LAOZI = [str(FIXTURES / "laozi.txt"), str(FIXTURES / "mwd_laozi.txt")]
 
 # disconnect logging for testing
 logging.captureWarnings(True)
@@ -31,3 +43,49 @@ class TestCommands(TestCase):
         with patch('sys.stdout', new=StringIO()) as output:
             self.assertRaises(SystemExit, run)
             self.assertEqual(output.getvalue().strip(), version.strip())
+
+
+class TestOutput(TestCase):
+    """Test writing results to an output file."""
+
+    def setUp(self) -> None:
+        """Create a temporary directory for output files."""
+        self.tmpdir = TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def tearDown(self) -> None:
+        """Remove extensions bound to the pipeline's components."""
+        remove_pipeline_extensions()
+
+    def test_jsonl(self) -> None:
+        """-o with a .jsonl extension should write one match per line"""
+        output = Path(self.tmpdir.name) / "out.jsonl"
+        sys.argv = ["dphon", *LAOZI, "-o", str(output)]
+        run()
+        with jsonlines.open(output) as reader:
+            rows = list(reader)
+        self.assertTrue(rows)
+        for row in rows:
+            self.assertEqual(tuple(row.keys()), MATCH_FIELDS)
+            self.assertEqual({row["u_id"], row["v_id"]}, {"laozi", "mwd_laozi"})
+
+    def test_csv(self) -> None:
+        """-o with a .csv extension should write a header and one row per match"""
+        output = Path(self.tmpdir.name) / "out.csv"
+        sys.argv = ["dphon", *LAOZI, "-o", str(output)]
+        run()
+        with output.open(encoding="utf8", newline="") as file:
+            reader = csv.DictReader(file)
+            rows = list(reader)
+        self.assertEqual(tuple(reader.fieldnames), MATCH_FIELDS)
+        self.assertTrue(rows)
+        for row in rows:
+            self.assertEqual({row["u_id"], row["v_id"]}, {"laozi", "mwd_laozi"})
+
+    def test_csv_empty(self) -> None:
+        """-o with a .csv extension should write a header even with no matches"""
+        output = Path(self.tmpdir.name) / "out.csv"
+        sys.argv = ["dphon", str(FIXTURES / "tiny.txt"), "-o", str(output)]
+        run()
+        with output.open(encoding="utf8", newline="") as file:
+            self.assertEqual(file.read().strip(), ",".join(MATCH_FIELDS))
@@ -33,6 +33,15 @@ class TestPlaintextCorpusLoader(TestCase):
                                 "tests/fixtures/laozi/laozi.txt"]):
                 pass
 
+    def test_directory(self) -> None:
+        """should warn if passed a directory"""
+        # Pass a directory and a text file; should warn
+        logging.disable(logging.INFO)
+        with self.assertLogs(level="WARNING"):
+            for _ in self.load(["tests/fixtures/laozi",
+                                "tests/fixtures/laozi/laozi.txt"]):
+                pass
+
     def test_single_file(self) -> None:
         """should load contents of a single file"""
         # Use a tiny file with no whitespace, etc. to strip
@@ -1,11 +1,13 @@
 """Tests for the phonemes module."""
 
 import logging
+from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
 import spacy
 from dphon.match import Match
-from dphon.g2p import GraphemesToPhonemes, OOV_PHONEMES
+from dphon.g2p import GraphemesToPhonemes, OOV_PHONEMES, get_sound_table_json
 from spacy.tokens import Doc, Span, Token
 
 # disconnect logging for testing
@@ -34,6 +36,7 @@ class TestG2P(TestCase):
     def test_defaults(self) -> None:
         """should create lookups sound table and register extensions"""
         self.assertTrue(self.nlp.vocab.lookups.has_table("phonemes"))
+        self.assertTrue(self.nlp.vocab.lookups.has_table("syllables"))
         self.assertTrue(Doc.has_extension("phonemes"))
         self.assertTrue(Span.has_extension("phonemes"))
         self.assertTrue(Token.has_extension("phonemes"))
@@ -109,3 +112,61 @@ class TestG2P(TestCase):
         self.assertEqual(self.px.get_token_phonemes(doc[3]), (OOV_PHONEMES,))
         # "!" is non-voiced, it should return a syllable of `None`s
         self.assertEqual(self.px.get_token_phonemes(doc[4]), (None, None))
+
+    def test_get_token_phonemes_cached(self) -> None:
+        """should only look up phonemes once per token text"""
+        doc = self.nlp("two by two")
+        with patch.object(
+            self.px, "_lookup_token_phonemes", wraps=self.px._lookup_token_phonemes
+        ) as lookup:
+            self.assertEqual(self.px.get_token_phonemes(doc[0]), ("t", "uː"))
+            self.assertEqual(self.px.get_token_phonemes(doc[2]), ("t", "uː"))
+            lookup.assert_called_once()
+
+    def test_get_token_phoneme_str(self) -> None:
+        """should return a token's phonemes joined as a single string"""
+        doc = self.nlp("one two 3 go!")
+        self.assertTrue(Token.has_extension("phoneme_str"))
+        # voiced tokens join all their phonemes
+        self.assertEqual(self.px.get_token_phoneme_str(doc[0]), "wʌn")
+        self.assertEqual(self.px.get_token_phoneme_str(doc[2]), "θriː")
+        # "go" isn't in the table, so it gets the OOV marker
+        self.assertEqual(self.px.get_token_phoneme_str(doc[3]), OOV_PHONEMES)
+        # "!" is non-voiced, so it has no phonetic content
+        self.assertEqual(self.px.get_token_phoneme_str(doc[4]), "")
+
+    def test_get_syllables(self) -> None:
+        """should return full syllable strings for each token in a span"""
+        doc = self.nlp("one two 3 go!")
+        # "go" and "!" have no entry, so their syllables are empty
+        self.assertEqual(doc[:]._.syllables, ["wʌn", "tuː", "θriː", "", ""])
+
+    def test_syllables_with_empty_parts(self) -> None:
+        """should skip unused syllable parts when building syllable strings"""
+        nlp = spacy.blank("en")
+        GraphemesToPhonemes(nlp, sound_table={"a": ("ʔ", None), "b": ("p", "a")})
+        self.assertEqual(nlp.vocab.lookups.get_table("syllables")["a"], "ʔ")
+
+
+class TestGetSoundTableJson(TestCase):
+    """Test loading a sound table from JSON."""
+
+    def test_load(self) -> None:
+        """should load the first reading of each entry without source info"""
+        path = Path(__file__).parents[2] / "dphon" / "data" / "sound_table_v2.json"
+        table = get_sound_table_json(path)
+        self.assertEqual(
+            table["哀"], ("", "", "", "ʔ", "ˤ", "", "ə", "j", "", "", "")
+        )
+
+    def test_cached(self) -> None:
+        """should only parse a sound table once per path"""
+        path = Path(__file__).parents[2] / "dphon" / "data" / "sound_table_v2.json"
+        self.assertIs(get_sound_table_json(path), get_sound_table_json(path))
+
+    def test_read_only(self) -> None:
+        """should not allow changes to the shared cached table"""
+        path = Path(__file__).parents[2] / "dphon" / "data" / "sound_table_v2.json"
+        table = get_sound_table_json(path)
+        with self.assertRaises(TypeError):
+            table["哀"] = ("",)  # type: ignore
@@ -8,7 +8,11 @@ from typing import Iterator
 import spacy
 from spacy.tokens import Doc, Token
 from dphon.console import err_console
+from dphon.g2p import GraphemesToPhonemes
 from dphon.index import LookupsIndex, NgramPhonemesLookupsIndex
+from dphon.ngrams import Ngrams
+
+from tests.unit import remove_pipeline_extensions
 
 # disconnect logging and capture stderr output for testing
 logging.disable(logging.CRITICAL)
@@ -83,9 +87,44 @@ class TestNgramPhonemesLookupsIndex(TestCase):
     def setUp(self) -> None:
         """Create a blank spaCy pipeline, index, and doc for testing."""
         self.nlp = spacy.blank("en")
+        # register extensions for this test's sound table, not another test's
+        remove_pipeline_extensions()
+        self.px = GraphemesToPhonemes(self.nlp, sound_table={
+            "to": ("t", "uː"),
+            "be": ("b", "iː"),
+            "or": ("", "ɔː"),
+            "not": ("n", "ɒt"),
+        })
+        # force using entire syllable for testing
+        self.px._select = lambda reading: reading  # type: ignore
+        Ngrams(self.nlp, n=2)
         self.idx = NgramPhonemesLookupsIndex(self.nlp)
         self.doc = self.nlp("To be or not to be")
 
+    def tearDown(self) -> None:
+        """Remove extensions registered for this test."""
+        remove_pipeline_extensions()
+
     def test_call(self) -> None:
         """foo"""
         pass
+
+    def test_get_vals(self) -> None:
+        """should only index ngrams that are voiced and have phonemes"""
+        doc = Doc(self.nlp.vocab, words=["be", "not", "to", "be", "to"],
+                  spaces=[False, False, True, False, False])
+        # "to be" spans whitespace, so it isn't indexed
+        vals = [ngram.text for ngram in self.idx._get_vals(doc)]
+        self.assertEqual(vals, ["benot", "notto", "beto"])
+
+    def test_get_vals_oov(self) -> None:
+        """should skip ngrams with non-alphabetic or out-of-vocabulary tokens"""
+        doc = Doc(self.nlp.vocab, words=["to", "be", "!", "be", "me", "not"],
+                  spaces=[False, False, False, False, False, False])
+        # "!" isn't voiced and "me" isn't in the sound table
+        vals = [ngram.text for ngram in self.idx._get_vals(doc)]
+        self.assertEqual(vals, ["tobe"])
+
+    def test_get_key(self) -> None:
+        """should key ngrams by their phonemes, skipping unused parts"""
+        self.assertEqual(self.idx._get_key(self.doc[1:3]), "biːɔː")